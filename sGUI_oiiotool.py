@@ -1,10 +1,17 @@
+import collections
+import io
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from enum import IntEnum
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QCloseEvent, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -12,13 +19,305 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _find_tool(name: str) -> str:
+    """
+    Locate a tool in the script folder, falling back to PATH.
+
+    Args:
+        name (str): File name of the executable.
+
+    Returns:
+        str: Absolute path to the executable, or its expected path in the
+        script folder if it cannot be found.
+    """
+    local_path = os.path.join(_SCRIPT_DIR, name)
+    if os.path.exists(local_path):
+        return local_path
+    found = shutil.which(name)
+    return os.path.abspath(found) if found else local_path
+
+
+# Resolved once at import, so no PATH search happens per spawned process
+_OIIOTOOL = _find_tool("oiiotool.exe")
+_IINFO = _find_tool("iinfo.exe")
+
+# Application-wide stylesheet, parsed once at startup
+APP_QSS = """
+QLabel#titleLabel {
+    font-family: 'Dank Mono', Arial;
+    font-size: 16px;
+    color: #2196f3;
+}
+QLabel#statusLabel {
+    font-family: 'Dank Mono', Arial;
+    font-size: 12px;
+    color: #FFFFFF;
+}
+QPlainTextEdit#statusLog, QPlainTextEdit#consoleLog {
+    border: none;
+    color: #FFFFFF;
+    font-family: 'Dank Mono', Arial;
+    font-size: 12px;
+}
+QPlainTextEdit#statusLog {
+    background-color: #242424;
+}
+QPlainTextEdit#consoleLog {
+    background-color: #232323;
+}
+QProgressBar#mainProgress {
+    border: none;
+    border-radius: 5px;
+    background-color: #232323; /* Background */
+    color: #FFFFFF; /* Text color */
+    height: 10px; /* Height */
+}
+QProgressBar#mainProgress::chunk {
+    background-color: #2196f3;
+}
+QCheckBox {
+    color: #FFFFFF;
+    font-family: 'Dank Mono', Arial;
+    font-size: 12px;
+    spacing: 10px;
+}
+QCheckBox::indicator:unchecked {
+    background-color: #4d4d4d;
+}
+QScrollBar:vertical {
+    border: none;
+    background: #2c2c2c;
+    width: 10px;
+    margin: 0px; /* Remove margin */
+}
+QScrollBar::handle:vertical {
+    background-color: #2196f3;
+    min-height: 20px;
+    border-radius: 5px;
+}
+QScrollBar::add-line:vertical {
+    height: 0;
+    subcontrol-position: bottom;
+    subcontrol-origin: margin;
+}
+QScrollBar::sub-line:vertical {
+    height: 0;
+    subcontrol-position: top;
+    subcontrol-origin: margin;
+}
+QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {
+    border: none;
+    background: none;
+    color: none;
+}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+    background: none;
+}
+"""
+
+# Do not open a console window for every spawned tool on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Tool output forwarded to the GUI per process, the rest is only logged
+_MAX_OUTPUT_CHARS = 16 * 1024
+_TRUNCATED_NOTE = "... (output truncated, see log for the rest)"
+
+# Spawn settings shared by every tool invocation
+_SPAWN_OPTIONS = {"shell": False, "close_fds": True, "creationflags": _CREATION_FLAGS}
+if os.name == "nt":
+    # Built once, subprocess copies it for each spawn
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+    _SPAWN_OPTIONS["startupinfo"] = _STARTUPINFO
+
+
+class _ExistsCache:
+    def __init__(self, ttl: float = 2.0):
+        """
+        Initialize the _ExistsCache.
+
+        Args:
+            ttl (float, optional): Seconds a cached result stays valid.
+                Defaults to 2.0.
+        """
+        self._d = {}
+        self._dirs = {}
+        self._ttl = ttl
+
+    def exists(self, path: str) -> bool:
+        """
+        Check if a path exists, reusing recent results.
+
+        Args:
+            path (str): Path to check.
+
+        Returns:
+            bool: True if the path exists, False otherwise.
+        """
+        now = time.monotonic()
+        cached = self._d.get(path)
+        if cached and now - cached[0] < self._ttl:
+            return cached[1]
+        directory, name = os.path.split(path)
+        listing = self._dirs.get(directory)
+        if listing and now - listing[0] < self._ttl:
+            result = os.path.normcase(name) in listing[1]
+        else:
+            result = os.path.exists(path)
+        self._d[path] = (now, result)
+        return result
+
+    def stat(self, path: str):
+        """
+        Stat a path, reusing the DirEntry of a fresh directory listing.
+
+        Args:
+            path (str): Path to stat.
+
+        Returns:
+            os.stat_result: Status of the path, or None if it does not exist.
+        """
+        directory, name = os.path.split(path)
+        listing = self._dirs.get(directory)
+        try:
+            if listing and time.monotonic() - listing[0] < self._ttl:
+                entry = listing[1].get(os.path.normcase(name))
+                return entry.stat() if entry is not None else None
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def prime_directory(self, directory: str):
+        """
+        List a directory once so checks for its entries need no stat call.
+
+        The DirEntry objects are kept, so their cached stat results can be
+        reused by stat().
+
+        Args:
+            directory (str): Directory to list.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                listing = {os.path.normcase(entry.name): entry for entry in entries}
+        except OSError:
+            return
+        self._dirs[directory] = (time.monotonic(), listing)
+
+    def invalidate(self, path: str):
+        """
+        Forget the cached result for a path.
+
+        Args:
+            path (str): Path that has been written or removed.
+        """
+        self._d.pop(path, None)
+        self._dirs.pop(os.path.dirname(path), None)
+
+    def clear(self):
+        """
+        Forget all cached results and directory listings.
+        """
+        self._d.clear()
+        self._dirs.clear()
+
+
+_exists_cache = _ExistsCache()
+
+
+def _split_ext(path: str) -> tuple:
+    """
+    Split a path into stem and extension.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        tuple: Path without the extension and the extension with its dot.
+    """
+    i = path.rfind(".")
+    j = max(path.rfind("/"), path.rfind("\\")) + 1
+    # Leading dots belong to the file name, as in os.path.splitext
+    while j < i and path[j] == ".":
+        j += 1
+    if i > j:
+        return path[:i], path[i:]
+    return path, ""
+
+
+class Kind(IntEnum):
+    """
+    What is done with a dropped file.
+    """
+
+    CHECK = 0
+    TX_TO_TIF = 1
+    TO_TX = 2
+
+
+@dataclass(slots=True)
+class FileJob:
+    """
+    A dropped file with its paths and existence checks resolved up front.
+
+    output_path is None when a .tx file is only checked, up_to_date is True
+    when the existing output is not older than the input.
+    """
+
+    path: str
+    kind: Kind
+    exists: bool
+    output_path: str | None
+    output_exists: bool
+    up_to_date: bool
+
+    @classmethod
+    def from_path(cls, path: str, *, convert_tif: bool) -> "FileJob":
+        """
+        Build a job for a dropped file.
+
+        Args:
+            path (str): Path to the file.
+            convert_tif (bool): Whether .tx files are converted to .tif.
+
+        Returns:
+            FileJob: The resolved job.
+        """
+        stem, ext = _split_ext(path)
+        if ext.lower() != ".tx":
+            kind = Kind.TO_TX
+            output_path = stem + ".tx"
+        elif convert_tif:
+            kind = Kind.TX_TO_TIF
+            output_path = stem + ".tif"
+        else:
+            kind = Kind.CHECK
+            output_path = None
+        exists = bool(path) and _exists_cache.exists(path)
+        output_exists = False
+        up_to_date = False
+        if exists and output_path is not None:
+            # One stat answers both existence and freshness of the output
+            dst = _exists_cache.stat(output_path)
+            if dst is not None:
+                output_exists = True
+                if dst.st_size > 0:
+                    src = _exists_cache.stat(path)
+                    up_to_date = src is not None and dst.st_mtime >= src.st_mtime
+        return cls(path, kind, exists, output_path, output_exists, up_to_date)
 
 
 def get_script_directory():
@@ -28,7 +327,7 @@ def get_script_directory():
     Returns:
         str: Directory path of the script.
     """
-    return os.path.dirname(os.path.abspath(__file__))
+    return _SCRIPT_DIR
 
 
 def check_required_files(console_text_edit):
@@ -36,56 +335,157 @@ def check_required_files(console_text_edit):
     Check for the presence of required files.
 
     Args:
-        console_text_edit (QTextEdit): Text edit widget for console information.
+        console_text_edit (QPlainTextEdit): Text edit widget for console information.
 
     Returns:
         bool: True if all required files are found, False otherwise.
     """
-    script_directory = get_script_directory()
-    required_files = [os.path.join(script_directory, "oiiotool.exe"), os.path.join(script_directory, "iinfo.exe")]
+    required_files = [_OIIOTOOL, _IINFO]
     missing_files = [
         file
         for file in required_files
-        if not os.path.exists(file)
+        if not _exists_cache.exists(file)
     ]
 
     if missing_files:
-        error_message = "Missing required files in the script folder:\n" + "\n".join(
+        error_message = "Missing required files in the script folder or PATH:\n" + "\n".join(
             missing_files
         )
-        console_text_edit.append(error_message)
-        logging.error(error_message)
+        console_text_edit.appendPlainText(error_message)
+        logger.error(error_message)
         return False
     else:
-        console_text_edit.append("All required files found.")
+        console_text_edit.appendPlainText("All required files found.")
         return True
 
 
-def run_with_version(console_text_edit, file_path):
+def _iter_lines(command: list):
+    """
+    Run a tool and yield its output line by line.
+
+    stderr is drained in a helper thread so a chatty stderr cannot block
+    the child while stdout is being read.
+
+    Args:
+        command (list): Absolute path to the executable followed by its arguments.
+
+    Yields:
+        tuple: ("out", line) for each stdout line, then ("err", line) for
+        each stderr line.
+    """
+    process = subprocess.Popen(
+        command,
+        executable=command[0],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=io.DEFAULT_BUFFER_SIZE,
+        **_SPAWN_OPTIONS,
+    )
+    stderr_lines = []
+    drain = threading.Thread(
+        target=lambda: stderr_lines.extend(process.stderr), daemon=True
+    )
+    drain.start()
+    try:
+        for line in process.stdout:
+            yield "out", line.rstrip("\n")
+        drain.join()
+        for line in stderr_lines:
+            yield "err", line.rstrip("\n")
+    finally:
+        process.stdout.close()
+        process.wait()
+        drain.join()
+        process.stderr.close()
+
+
+def _run_tool(command: list, capture: bool = True, on_line=None) -> tuple:
+    """
+    Run a tool with the spawn settings shared by all helpers.
+
+    Args:
+        command (list): Absolute path to the executable followed by its arguments.
+        capture (bool, optional): Whether to capture stdout. Defaults to True.
+        on_line (callable, optional): Called with each stdout line as it is
+            read, instead of collecting stdout. Defaults to None.
+
+    Returns:
+        tuple: stdout and stderr from the process. Only the first
+        _MAX_OUTPUT_CHARS of stdout are returned or forwarded.
+    """
+    if on_line is not None:
+        stderr_lines = []
+        # Streamed lines are only kept when they will be logged
+        log_lines = [] if logger.isEnabledFor(logging.INFO) else None
+        forwarded = 0
+        truncated = False
+        for tag, line in _iter_lines(command):
+            if tag == "err":
+                stderr_lines.append(line)
+                continue
+            if log_lines is not None:
+                log_lines.append(line)
+            if truncated:
+                continue
+            forwarded += len(line) + 1
+            if forwarded > _MAX_OUTPUT_CHARS:
+                truncated = True
+                on_line(_TRUNCATED_NOTE)
+            else:
+                on_line(line)
+        if log_lines:
+            logger.info("Standard output: %s", "\n".join(log_lines))
+        stdout, stderr = "", "\n".join(stderr_lines)
+    else:
+        # Read raw bytes and decode once, instead of decoding incrementally
+        result = subprocess.run(
+            command,
+            executable=command[0],
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+            **_SPAWN_OPTIONS,
+        )
+        stdout = (result.stdout or b"").decode("utf-8", "replace")
+        stderr = (result.stderr or b"").decode("utf-8", "replace")
+    if stdout and logger.isEnabledFor(logging.INFO):
+        logger.info("Standard output: %s", stdout)
+    if stderr:
+        logger.error("Standard error: %s", stderr)
+    if len(stdout) > _MAX_OUTPUT_CHARS:
+        stdout = stdout[:_MAX_OUTPUT_CHARS] + "\n" + _TRUNCATED_NOTE
+    return stdout, stderr
+
+
+def run_with_version(file_path: str) -> str:
     """
     Run the executable file with the --version argument.
 
     Args:
-        console_text_edit (QTextEdit): Text edit widget for console information.
         file_path (str): Path to the executable file.
+
+    Returns:
+        str: Console line with the version info or the error message.
     """
     try:
         command = [file_path, "--version"]
-        result = subprocess.run(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        version_info = result.stdout.strip()
-        console_text_edit.append(f"{file_path}: {version_info}")
-        return version_info
+        stdout, _ = _run_tool(command)
+        version_info = stdout.strip()
+        return f"{file_path}: {version_info}"
     except Exception as e:
         error_message = f"An error occurred while running {file_path}: {e}"
-        console_text_edit.append(error_message)
-        logging.error(error_message)
-        return None
+        logger.error(error_message)
+        return error_message
 
 
 def convert_to_tx(
-    input_file: str, output_file: str, add_runstats: bool = False
+    input_file: str,
+    output_file: str,
+    add_runstats: bool = False,
+    capture: bool = False,
+    on_line=None,
 ) -> tuple:
     """
     Convert input file to a .tx file.
@@ -94,87 +494,164 @@ def convert_to_tx(
         input_file (str): Path to the input file.
         output_file (str): Path to save the output .tx file.
         add_runstats (bool, optional): Whether to add runstats. Defaults to False.
+        capture (bool, optional): Whether to capture stdout. Defaults to False.
+        on_line (callable, optional): Receives stdout line by line instead
+            of it being returned. Defaults to None.
 
     Returns:
         tuple: stdout and stderr from the process.
     """
     try:
-        oiiotool_path = os.path.join(get_script_directory(), "oiiotool.exe")
-        command = [oiiotool_path, input_file, "-otex", output_file]
+        command = [_OIIOTOOL, input_file, "-otex", output_file]
         if add_runstats:
             command.append("--runstats")
-        process = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        stdout, stderr = process.communicate()
-        if stdout:
-            logging.info("Standard output: %s", stdout)
-        if stderr:
-            logging.error("Standard error: %s", stderr)
-        return stdout, stderr
+        return _run_tool(command, capture, on_line)
     except Exception as e:
-        error_message = f"An error occurred during conversion to .tx: {e}"
-        logging.error(error_message)
+        logger.error("An error occurred during conversion to .tx: %s", e)
         return "", str(e)
 
 
-def check_tx_file(tx_file: str) -> tuple:
+def check_tx_file(tx_file: str, on_line=None) -> tuple:
     """
     Check information of a .tx file.
 
     Args:
         tx_file (str): Path to the .tx file.
+        on_line (callable, optional): Receives stdout line by line instead
+            of it being returned. Defaults to None.
 
     Returns:
         tuple: stdout and stderr from the process.
     """
     try:
-        iinfo_path = os.path.join(get_script_directory(), "iinfo.exe")
-        command = [iinfo_path, "-v", tx_file]
-        process = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        stdout, stderr = process.communicate()
-        if stdout:
-            logging.info("Standard output: %s", stdout)
-        if stderr:
-            logging.error("Standard error: %s", stderr)
-        return stdout, stderr
+        command = [_IINFO, "-v", tx_file]
+        return _run_tool(command, on_line=on_line)
     except Exception as e:
-        error_message = f"An error occurred while checking .tx file: {e}"
-        logging.error(error_message)
+        logger.error("An error occurred while checking .tx file: %s", e)
         return "", str(e)
 
 
-def convert_tx_to_tif(tx_file: str, output_tif: str) -> tuple:
+def convert_tx_to_tif(tx_file: str, output_tif: str, capture: bool = False) -> tuple:
     """
     Convert .tx file to .tif file.
 
     Args:
         tx_file (str): Path to the input .tx file.
         output_tif (str): Path to save the output .tif file.
+        capture (bool, optional): Whether to capture stdout. Defaults to False.
 
     Returns:
         tuple: stdout and stderr from the process.
     """
     try:
-        oiiotool_path = os.path.join(get_script_directory(), "oiiotool.exe")
-        command = [oiiotool_path, tx_file, "-o", output_tif]
-        process = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        stdout, stderr = process.communicate()
-        if stdout:
-            logging.info("Standard output: %s", stdout)
-        if stderr:
-            logging.error("Standard error: %s", stderr)
-        return stdout, stderr
+        command = [_OIIOTOOL, tx_file, "-o", output_tif]
+        return _run_tool(command, capture)
     except Exception as e:
-        error_message = f"An error occurred during conversion from .tx to .tif: {e}"
-        logging.error(error_message)
+        logger.error("An error occurred during conversion from .tx to .tif: %s", e)
         return "", str(e)
 
 
+def process_tx_file(job: FileJob, *, runstats: bool, on_line=None) -> tuple:
+    """
+    Process .tx file based on user choice.
+
+    Runs in a worker thread, so overwriting must already be confirmed and
+    the checkbox states are passed in instead of read from the widgets.
+
+    Args:
+        job (FileJob): The file to process.
+        runstats (bool): Whether to add runstats to TX conversions.
+        on_line (callable, optional): Receives iinfo and runstats output
+            line by line instead of it being returned. Defaults to None.
+
+    Returns:
+        tuple: stdout and stderr from the process.
+    """
+    match job.kind:
+        case Kind.CHECK:
+            return check_tx_file(job.path, on_line)
+        case Kind.TX_TO_TIF:
+            stdout, stderr = convert_tx_to_tif(job.path, job.output_path)
+        case Kind.TO_TX:
+            # Output is only worth capturing when runstats are requested
+            stdout, stderr = convert_to_tx(
+                job.path,
+                job.output_path,
+                runstats,
+                capture=runstats,
+                on_line=on_line if runstats else None,
+            )
+    _exists_cache.invalidate(job.output_path)
+
+    return stdout, stderr
+
+
+class JobSignals(QObject):
+    """
+    Signals emitted by background jobs.
+
+    finished carries the file path, stdout and stderr of a processed file,
+    console_line carries a single line for the console.
+    """
+
+    finished = Signal(str, str, str)
+    console_line = Signal(str)
+
+
+class ConvertJob(QRunnable):
+    def __init__(self, job: FileJob, signals: JobSignals, *, runstats: bool):
+        """
+        Initialize the ConvertJob.
+
+        Args:
+            job (FileJob): The file to process.
+            signals (JobSignals): Signals to report the result through.
+            runstats (bool): Whether to add runstats to TX conversions.
+        """
+        super().__init__()
+        self.job = job
+        self.runstats = runstats
+        self.signals = signals
+
+    def run(self):
+        """
+        Process the file in a worker thread and report the result.
+        """
+        # Lines of parallel jobs interleave in the console, so tag each one
+        name = os.path.basename(self.job.path)
+        emit = self.signals.console_line.emit
+
+        try:
+            stdout, stderr = process_tx_file(
+                self.job,
+                runstats=self.runstats,
+                on_line=lambda line: emit(f"{name}: {line}"),
+            )
+        except Exception as e:
+            stdout, stderr = "", str(e)
+        self.signals.finished.emit(self.job.path, stdout, stderr)
+
+
+class VersionJob(QRunnable):
+    def __init__(self, file_path: str, signals: JobSignals):
+        """
+        Initialize the VersionJob.
+
+        Args:
+            file_path (str): Path to the executable file.
+            signals (JobSignals): Signals to report the version through.
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = signals
+
+    def run(self):
+        """
+        Query the tool version in a worker thread and report it.
+        """
+        self.signals.console_line.emit(run_with_version(self.file_path))
+
+
 class DragDropWidget(QWidget):
     def __init__(self):
         """
@@ -182,88 +659,68 @@ class DragDropWidget(QWidget):
         """
         super().__init__()
 
+        # Batch state, updated as background jobs finish
+        self._jobs_total = 0
+        self._jobs_done = 0
+        self._status_model = {"processed": [], "errors": []}
+
+        # Output paths of queued or running jobs, keyed by input path, so no
+        # two jobs ever write the same file at once
+        self._outputs_in_flight = {}
+
+        # Results from worker threads are delivered on the GUI thread
+        self.job_signals = JobSignals()
+        self.job_signals.finished.connect(
+            self._on_job_finished, Qt.QueuedConnection
+        )
+        self.job_signals.console_line.connect(
+            self._on_console_line, Qt.QueuedConnection
+        )
+
+        # Bounded pool for conversions, one oiiotool process per core
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(os.cpu_count() or 4)
+
         # Setting Fusion style for the whole application
         QApplication.setStyle("fusion")
 
         self.label = QLabel("Convert to TX file:")
+        self.label.setObjectName("titleLabel")
+        self.label.setTextFormat(Qt.PlainText)
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setStyleSheet(
-            "font-family: 'Dank Mono', Arial; font-size: 16px; color: #2196f3;"
-        )
         self.label.setMinimumHeight(50)  # Setting minimum height
 
-        # Creating QTextEdit for status bar
-        self.status_text_edit = QTextEdit()
+        # Creating label for status summary
+        self.status_label = QLabel("No processed files")
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setTextFormat(Qt.PlainText)
+
+        # Creating QPlainTextEdit for status bar
+        self.status_text_edit = QPlainTextEdit()
+        self.status_text_edit.setObjectName("statusLog")
         self.status_text_edit.setReadOnly(True)
-        self.status_text_edit.setStyleSheet(
-            """
-            QTextEdit {
-                border: none;
-                background-color: #242424;
-                color: #FFFFFF;
-                font-family: 'Dank Mono', Arial;
-                font-size: 12px;
-            }
-            """
-        )
+
         # Creating separator
         separator = QFrame()
         separator.setFrameShape(QFrame.VLine)
         separator.setFrameShadow(QFrame.Sunken)
 
-        # Creating QTextEdit for console information
-        self.console_text_edit = QTextEdit()
+        # Creating QPlainTextEdit for console information
+        self.console_text_edit = QPlainTextEdit()
+        self.console_text_edit.setObjectName("consoleLog")
         self.console_text_edit.setReadOnly(True)
-        self.console_text_edit.setStyleSheet(
-            """
-            QTextEdit {
-                border: none;
-                background-color: #232323;
-                color: #FFFFFF;
-                font-family: 'Dank Mono', Arial;
-                font-size: 12px;
-            }
-            """
-        )
+        # Drop the oldest lines once the console gets long
+        self.console_text_edit.setMaximumBlockCount(5000)
 
         # Creating progress bar
         self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("mainProgress")
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(
-            """
-            QProgressBar {
-                border: none;
-                border-radius: 5px;
-                background-color: #232323; /* Background */
-                color: #FFFFFF; /* Text color */
-                height: 10px; /* Height */
-            }
-            QProgressBar::chunk {
-                background-color: #2196f3;
-            }
-            """
-        )
 
         # Creating checkboxes
         self.checkbox1 = QCheckBox("show stats")
         self.checkbox2 = QCheckBox("convert tx to tif")
 
-        # Applying styles to checkboxes
-        for checkbox in (self.checkbox1, self.checkbox2):
-            checkbox.setStyleSheet(
-                """
-                QCheckBox {
-                    color: #FFFFFF;
-                    font-family: 'Dank Mono', Arial;
-                    font-size: 12px;
-                    spacing: 10px;
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: #4d4d4d;
-                }
-                """
-            )
-
         # Creating layout
         layout = QVBoxLayout()
         layout.addWidget(self.label)
@@ -276,7 +733,8 @@ class DragDropWidget(QWidget):
         checkboxes_layout.addWidget(self.checkbox1)
         checkboxes_layout.addWidget(self.checkbox2)
 
-        # Adding QTextEdit to layout
+        # Adding status widgets and QPlainTextEdit to layout
+        layout.addWidget(self.status_label)
         layout.addWidget(self.status_text_edit)
         layout.addWidget(separator)
         layout.addWidget(self.console_text_edit)
@@ -294,40 +752,21 @@ class DragDropWidget(QWidget):
         self.checkbox1.setChecked(True)
         self.checkbox2.setChecked(False)
 
-        # Adding custom style for scroll bars
-        self.setStyleSheet(
-            """
-            QScrollBar:vertical {
-                border: none;
-                background: #2c2c2c;
-                width: 10px;
-                margin: 0px; /* Remove margin */
-            }
-            QScrollBar::handle:vertical {
-                background-color: #2196f3;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical {
-                height: 0;
-                subcontrol-position: bottom;
-                subcontrol-origin: margin;
-            }
-            QScrollBar::sub-line:vertical {
-                height: 0;
-                subcontrol-position: top;
-                subcontrol-origin: margin;
-            }
-            QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {
-                border: none;
-                background: none;
-                color: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            """
-        )
+        # Overwrite confirmation dialog, reused for every prompt
+        self._ow_box = QMessageBox(self)
+        self._ow_box.setWindowTitle("Confirm Overwrite")
+        self._ow_box.setTextFormat(Qt.PlainText)
+        self._ow_box.setIcon(QMessageBox.Warning)
+
+        # Coalescing UI updates from finished jobs, armed by the first
+        # result after a flush so the timer stays idle between batches
+        self._pending_console = []
+        self._pending_status = []
+        self._pending_progress = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(80)
+        self._flush_timer.timeout.connect(self._flush_ui)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """
@@ -356,124 +795,255 @@ class DragDropWidget(QWidget):
         else:
             event.ignore()
 
-    def process_tx_file(self, file_path: str) -> tuple:
+    def closeEvent(self, event: QCloseEvent):
         """
-        Process .tx file based on user choice.
+        Handle close event.
 
-        Args:
-            file_path (str): Path to the file.
-
-        Returns:
-            tuple: stdout and stderr from the process.
-        """
-        stdout, stderr = "", ""
-        if not os.path.exists(file_path):
-            stderr = f"File not found: {file_path}"
-        elif file_path.endswith(".tx") and not self.checkbox2.isChecked():
-            stdout, stderr = check_tx_file(file_path)
-        elif file_path.endswith(".tx") and self.checkbox2.isChecked():
-            output_file_path = os.path.splitext(file_path)[0] + ".tif"
-            if os.path.exists(output_file_path):
-                overwrite = self.confirm_overwrite(output_file_path)
-                if not overwrite:
-                    return stdout, stderr
-            stdout, stderr = convert_tx_to_tif(file_path, output_file_path)
-        else:
-            output_file_path = os.path.splitext(file_path)[0] + ".tx"
-            if os.path.exists(output_file_path):
-                overwrite = self.confirm_overwrite(output_file_path)
-                if not overwrite:
-                    return stdout, stderr
-            stdout, stderr = convert_to_tx(
-                file_path, output_file_path, self.checkbox1.isChecked()
-            )
+        Jobs that have not started yet are discarded, so closing the window
+        does not keep launching oiiotool for the rest of a batch.
 
-        return stdout, stderr
+        Args:
+            event (QCloseEvent): The event object.
+        """
+        self.thread_pool.clear()
+        super().closeEvent(event)
 
     def process_dropped_files(self, file_urls: list):
         """
         Process files dropped onto the widget.
 
+        Overwrite confirmation happens here on the GUI thread, the
+        conversions themselves run in parallel in the widget's thread pool.
+
         Args:
             file_urls (list): List of file URLs.
         """
-        processed_files = []
-        error_messages = []
-        console_output = []
-        total_files = len(file_urls)
-        files_processed = 0
+        # Results only need to live for one drop, so the cache never grows
+        # across a long session
+        _exists_cache.clear()
 
+        # Checkbox states apply to the whole drop
+        runstats = self.checkbox1.isChecked()
+        convert_tif = self.checkbox2.isChecked()
+
+        candidate_paths = []
         for url in file_urls:
-            file_path = url.toLocalFile()
+            if url.isLocalFile():
+                candidate_paths.append(url.toLocalFile())
+            else:
+                self.update_console_text(
+                    f"Skipped (not a local file): {url.toString()}"
+                )
+
+        # List each directory once when several files come from it
+        files_per_dir = collections.Counter(
+            os.path.dirname(file_path) for file_path in candidate_paths
+        )
+        for directory, count in files_per_dir.items():
+            if directory and count > 1:
+                _exists_cache.prime_directory(directory)
+
+        # Resolve paths and existence once, then reject missing files
+        # before any prompt or subprocess
+        valid_jobs = []
+        for file_path in candidate_paths:
+            job = FileJob.from_path(file_path, convert_tif=convert_tif)
+            if not job.exists:
+                self.update_console_text(f"Skipped (not found): {file_path}")
+            elif job.up_to_date and not (runstats and job.kind is Kind.TO_TX):
+                # Output is newer than the input, converting again is wasted
+                # work unless runstats were asked for a TX conversion
+                self.update_console_text(f"Skipped (up to date): {job.output_path}")
+            else:
+                valid_jobs.append(job)
+
+        # Skip files whose output another job of this or an earlier drop
+        # is already going to write
+        claimed = set(self._outputs_in_flight.values())
+        unclaimed_jobs = []
+        for job in valid_jobs:
+            if job.output_path is None:
+                unclaimed_jobs.append(job)
+                continue
+            output_key = os.path.normcase(os.path.normpath(job.output_path))
+            if output_key in claimed:
+                self.update_console_text(
+                    f"Skipped (output already being written): {job.path}"
+                )
+                continue
+            claimed.add(output_key)
+            unclaimed_jobs.append(job)
+        valid_jobs = unclaimed_jobs
+
+        # Ask about all existing outputs before anything is queued
+        conflicts = [job.output_path for job in valid_jobs if job.output_exists]
+        overwritable = self.confirm_overwrites(conflicts) if conflicts else set()
+        jobs = [
+            job
+            for job in valid_jobs
+            if not job.output_exists or job.output_path in overwritable
+        ]
+
+        if not jobs:
+            return
+
+        if self._jobs_done == self._jobs_total:
+            # Previous batch is complete, start a new one
+            self._flush_ui()
+            self._jobs_total = 0
+            self._jobs_done = 0
+            self._status_model = {"processed": [], "errors": []}
+            self.status_text_edit.clear()
+            self.update_status_bar()
+        self._jobs_total += len(jobs)
+
+        for job in jobs:
+            if job.output_path is not None:
+                self._outputs_in_flight[job.path] = os.path.normcase(
+                    os.path.normpath(job.output_path)
+                )
+            self.thread_pool.start(ConvertJob(job, self.job_signals, runstats=runstats))
+
+    def _on_job_finished(self, file_path: str, stdout: str, stderr: str):
+        """
+        Handle a finished background job.
 
-            try:
-                stdout, stderr = self.process_tx_file(file_path)
-                if stderr:
-                    error_messages.append(stderr)
-                if stdout:
-                    console_output.append(stdout)
-                processed_files.append(file_path)
-            except Exception as e:
-                error_messages.append(str(e))
+        Args:
+            file_path (str): Path to the processed file.
+            stdout (str): Standard output of the process.
+            stderr (str): Standard error of the process.
+        """
+        self._jobs_done += 1
+        self._outputs_in_flight.pop(file_path, None)
+        self._status_model["processed"].append(file_path)
+        self._pending_status.append(file_path)
+        if stderr:
+            self._status_model["errors"].append(stderr)
+            self._pending_status.append(f"Error: {stderr}")
+        if stdout:
+            self._pending_console.append(stdout)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._pending_console.append(f"File {file_path} has been processed.")
+
+        if self._jobs_done == self._jobs_total:
+            self._pending_console.append(
+                f"[batch] {len(self._status_model['processed'])} files processed; "
+                f"{len(self._status_model['errors'])} errors"
+            )
+            # Reset progress bar
+            self._pending_progress = 0
+        else:
+            self._pending_progress = self._jobs_done * 100 // self._jobs_total
 
-            files_processed += 1
-            progress = int((files_processed / total_files) * 100)
-            self.progress_bar.setValue(progress)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-            console_output.append(f"File {file_path} has been processed.")
+    def _on_console_line(self, line: str):
+        """
+        Queue a console line from a background job.
 
-        self.update_status_bar(processed_files, error_messages)
-        if console_output:
-            self.update_console_text("\n".join(console_output))
+        Args:
+            line (str): Line to display in the console.
+        """
+        self._pending_console.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-    def confirm_overwrite(self, file_path: str) -> bool:
+    def _flush_ui(self):
+        """
+        Write pending job results to the widgets.
+        """
+        self._flush_timer.stop()
+        if self._pending_status:
+            self.status_text_edit.appendPlainText("\n".join(self._pending_status))
+            self._pending_status.clear()
+            self.update_status_bar()
+        if self._pending_console:
+            self.update_console_text("\n".join(self._pending_console))
+            self._pending_console.clear()
+        self.progress_bar.setValue(self._pending_progress)
+
+    def confirm_overwrites(self, conflicts: list) -> set:
+        """
+        Confirm overwriting of all existing outputs of a drop.
+
+        Args:
+            conflicts (list): Paths of the existing output files.
+
+        Returns:
+            set: Paths the user agreed to overwrite.
+        """
+        overwritable = set()
+        for index, file_path in enumerate(conflicts):
+            remaining = conflicts[index:]
+            response = self.confirm_overwrite(file_path, remaining)
+            if response == QMessageBox.YesToAll:
+                overwritable.update(remaining)
+                break
+            elif response == QMessageBox.Yes:
+                overwritable.add(file_path)
+            elif response in (QMessageBox.NoToAll, QMessageBox.Cancel):
+                break
+        return overwritable
+
+    def confirm_overwrite(self, file_path: str, remaining: list = ()) -> int:
         """
         Confirm file overwrite.
 
         Args:
             file_path (str): Path to the file to be overwritten.
+            remaining (list, optional): Existing outputs still to be
+                confirmed, including file_path. Defaults to ().
 
         Returns:
-            bool: True if overwrite confirmed, False otherwise.
+            int: The button the user clicked.
         """
-        msg_box = QMessageBox()
-        msg_box.setWindowTitle("Confirm Overwrite")
+        msg_box = self._ow_box
         msg_box.setText(
             f"File {file_path} already exists. Do you want to overwrite it?"
         )
-        msg_box.setIcon(QMessageBox.Warning)
-        msg_box.setStandardButtons(
-            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-        )
+        if len(remaining) > 1:
+            msg_box.setInformativeText(
+                f"{len(remaining) - 1} more existing files follow."
+            )
+            msg_box.setDetailedText("\n".join(remaining))
+            msg_box.setStandardButtons(
+                QMessageBox.Yes
+                | QMessageBox.YesToAll
+                | QMessageBox.No
+                | QMessageBox.NoToAll
+            )
+            # Esc and the close button skip the rest of the drop
+            msg_box.setEscapeButton(QMessageBox.NoToAll)
+        else:
+            # Empty texts hide the extra line and the details button
+            msg_box.setInformativeText("")
+            msg_box.setDetailedText("")
+            msg_box.setStandardButtons(
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+            )
+            msg_box.setEscapeButton(QMessageBox.Cancel)
         msg_box.setDefaultButton(QMessageBox.No)
-        response = msg_box.exec()
-        return response == QMessageBox.Yes
+        return msg_box.exec()
 
-    def update_status_bar(self, processed_files: list, error_messages: list):
+    def update_status_bar(self):
         """
-        Update status bar.
+        Update status bar summary.
 
-        Args:
-            processed_files (list): List of processed file paths.
-            error_messages (list): List of error messages.
+        File paths and errors are appended to the status text edit as jobs
+        finish, only the summary line is rendered here.
         """
-        status_text = ""
+        processed_files = self._status_model["processed"]
+        error_messages = self._status_model["errors"]
         if processed_files:
-            num_files = len(processed_files)
-            status_text += f"Number of processed files: {num_files}\n\n"
-            status_text += "Processed files:\n"
-            status_text += "\n".join(processed_files)
+            status_text = f"Number of processed files: {len(processed_files)}"
         else:
-            status_text += "No processed files\n\n"
+            status_text = "No processed files"
 
         if error_messages:
-            status_text += "\n\nErrors:\n"
-            status_text += "\n".join(error_messages)
-
-        self.status_text_edit.setPlainText(status_text)
+            status_text += f", errors: {len(error_messages)}"
 
-        # Reset progress bar
-        self.progress_bar.setValue(0)
+        self.status_label.setText(status_text)
 
     def update_console_text(self, text):
         """
@@ -482,18 +1052,20 @@ class DragDropWidget(QWidget):
         Args:
             text (str): Text to display in the console.
         """
-        self.console_text_edit.append(text)
+        self.console_text_edit.appendPlainText(text)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     widget = DragDropWidget()
     widget.setWindowTitle("Simple GUI for oiiotool 0.35")
     widget.resize(800, 600)
     if check_required_files(widget.console_text_edit):
-        for file in ["oiiotool.exe", "iinfo.exe"]:
-            run_with_version(
-                widget.console_text_edit, os.path.join(get_script_directory(), file)
-            )
         widget.show()
+        # Version probes run in parallel, the window does not wait for them
+        for file_path in (_OIIOTOOL, _IINFO):
+            QThreadPool.globalInstance().start(
+                VersionJob(file_path, widget.job_signals)
+            )
         sys.exit(app.exec())